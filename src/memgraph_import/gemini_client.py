@@ -29,6 +29,13 @@ class GeminiClient:
         self.client = genai.Client(api_key=self.api_key)
         self.model = "gemini-2.0-flash-lite"
         self.system_instruction = self._load_system_instruction()
+        # The system instruction never changes, so build its Part and the
+        # request config once instead of per request.
+        self._system_part = types.Part.from_text(text=self.system_instruction)
+        self._generate_content_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            system_instruction=[self._system_part],
+        )
 
     def _load_system_instruction(self) -> str:
         """Load the system instruction for knowledge graph generation."""
@@ -71,17 +78,10 @@ class GeminiClient:
             ),
         ]
 
-        generate_content_config = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            system_instruction=[
-                types.Part.from_text(text=self.system_instruction),
-            ],
-        )
-
         response = self.client.models.generate_content(
             model=self.model,
             contents=contents,
-            config=generate_content_config,
+            config=self._generate_content_config,
         )
 
         # Parse the response into a KnowledgeGraph object
@@ -109,15 +109,10 @@ class GeminiClient:
             ),
         ]
 
-        generate_content_config = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            system_instruction=[types.Part.from_text(text=self.system_instruction)],
-        )
-
         response = await self.client.aio.models.generate_content(
             model=self.model,
             contents=contents,
-            config=generate_content_config,
+            config=self._generate_content_config,
         )
 
         return self._parse_response(response)
@@ -3,42 +3,109 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
+import os
 import re
-import uuid
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+try:  # optional SIMD-accelerated JSON parser
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # optional streaming JSON parser for large blobs
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+# Below this size a full parse beats ijson's event-stream overhead.
+_STREAM_THRESHOLD = 4096
+
 logger = logging.getLogger(__name__)
 
 
+_JSON_DECODE_ERRORS = (
+    (json.JSONDecodeError, orjson.JSONDecodeError)
+    if orjson is not None
+    else (json.JSONDecodeError,)
+)
+
+
+def _loads(json_str: str) -> Any:
+    """Parse a JSON string with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=100_000)
 def generate_deterministic_uuid(
     label: str, name: Optional[str] = None, node_id: Optional[int] = None
 ) -> str:
-    """Generate a deterministic UUID using label and name or node id."""
-    namespace = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
+    """Generate a deterministic UUID using label and name or node id.
+
+    Results are memoized (bounded at 100k entries): the same entities
+    recur across many chunks, so repeat calls become dict lookups instead
+    of fresh digests. Use
+    ``generate_deterministic_uuid.cache_clear()`` to release the cache in
+    long-running processes.
+
+    Hashes with BLAKE2b at a 16-byte digest size, which is faster than
+    the SHA-1 path ``uuid.uuid5`` uses and already yields exactly the
+    128 bits a UUID needs. Ids are stable across runs but are not RFC
+    4122 version-5 values; only relative identity matters here.
+    """
     if name:
         combined = f"{label}:{name}"
     elif node_id is not None:
         combined = f"{label}:node_{node_id}"
     else:
         combined = f"{label}:unnamed"
-    return str(uuid.uuid5(namespace, combined))
+    digest = blake2b(combined.encode("utf-8"), digest_size=16).digest()
+    # Format the canonical string directly; no UUID object needed.
+    hex_digest = digest.hex()
+    return (
+        f"{hex_digest[:8]}-{hex_digest[8:12]}-{hex_digest[12:16]}"
+        f"-{hex_digest[16:20]}-{hex_digest[20:]}"
+    )
+
+
+_ESCAPE_FIX_RE = re.compile(r"\\\\(?![\"\\\\/bfnrt]|u[0-9a-fA-F]{4})")
 
 
 def clean_json_string(json_str: str) -> str:
     """Attempt to clean up common JSON escape issues."""
     try:
-        cleaned = re.sub(r"\\\\(?![\"\\\\/bfnrt]|u[0-9a-fA-F]{4})", r"\\\\\\", json_str)
+        cleaned = _ESCAPE_FIX_RE.sub(r"\\\\\\", json_str)
         return cleaned
     except Exception:
         return json_str
 
 
-def convert_nodes_to_uuid(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Convert node ids in a list of KG chunks to UUIDs."""
+def convert_nodes_to_uuid(
+    data: List[Dict[str, Any]], *, copy: bool = True
+) -> List[Dict[str, Any]]:
+    """Convert node ids in a list of KG chunks to UUIDs.
+
+    With ``copy=False`` the chunks are mutated in place, skipping one dict
+    allocation per entity; callers that own the parsed data (e.g. fresh
+    from a JSON parse) should pass it.
+    """
     converted: List[Dict[str, Any]] = []
     for chunk in data:
         mapping: Dict[Any, str] = {}
@@ -50,54 +117,150 @@ def convert_nodes_to_uuid(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             new_id = generate_deterministic_uuid(label, name, old_id)
             if old_id is not None:
                 mapping[old_id] = new_id
-            new_node = dict(node)
+            new_node = dict(node) if copy else node
             new_node["id"] = new_id
             if not new_node.get("name"):
                 new_node["name"] = f"{label}_{old_id}" if old_id else label
             new_nodes.append(new_node)
         new_rels = []
+        remap = mapping.get
         for rel in chunk.get("relationships", []):
-            new_rel = dict(rel)
-            if rel.get("start_id") in mapping:
-                new_rel["start_id"] = mapping[rel["start_id"]]
-            if rel.get("end_id") in mapping:
-                new_rel["end_id"] = mapping[rel["end_id"]]
+            new_rel = dict(rel) if copy else rel
+            if "start_id" in new_rel:
+                start_id = new_rel["start_id"]
+                new_rel["start_id"] = remap(start_id, start_id)
+            if "end_id" in new_rel:
+                end_id = new_rel["end_id"]
+                new_rel["end_id"] = remap(end_id, end_id)
             new_rels.append(new_rel)
-        new_chunk = dict(chunk)
-        new_chunk["nodes"] = new_nodes
-        new_chunk["relationships"] = new_rels
+        if copy:
+            new_chunk = dict(chunk)
+            new_chunk["nodes"] = new_nodes
+            new_chunk["relationships"] = new_rels
+        else:
+            new_chunk = chunk
         converted.append(new_chunk)
     return converted
 
 
-def process_kg_json_row(kg_json_str: str, row_index: int) -> Tuple[str, bool, str]:
-    """Process a single KG JSON row and convert ids to UUIDs."""
+def _intern_vocab(chunks: List[Dict[str, Any]]) -> None:
+    """Intern label/type strings, which are drawn from a tiny vocabulary.
+
+    Repeated values then share one string object, so downstream equality
+    checks are pointer comparisons and groupbys reuse cached hashes.
+    """
+    for chunk in chunks:
+        for node in chunk.get("nodes", []):
+            label = node.get("label")
+            if type(label) is str:
+                node["label"] = sys.intern(label)
+        for rel in chunk.get("relationships", []):
+            for key in ("type", "relationship_type"):
+                value = rel.get(key)
+                if type(value) is str:
+                    rel[key] = sys.intern(value)
+
+
+def process_kg_json_row_obj(kg_data: Any, row_index: int) -> Tuple[Any, bool, str]:
+    """Convert ids to UUIDs on an already-parsed KG value, in place."""
     try:
-        cleaned = clean_json_string(kg_json_str)
-        data = json.loads(cleaned)
-        chunks = [data] if isinstance(data, dict) else data
-        converted = convert_nodes_to_uuid(chunks)
-        result = converted[0] if isinstance(data, dict) else converted
-        return json.dumps(result), True, ""
-    except json.JSONDecodeError as e:
-        return kg_json_str, False, f"JSON decode error: {e}"
+        chunks = [kg_data] if isinstance(kg_data, dict) else kg_data
+        converted = convert_nodes_to_uuid(chunks, copy=False)
+        _intern_vocab(converted)
+        result = converted[0] if isinstance(kg_data, dict) else converted
+        return result, True, ""
     except Exception as e:  # pragma: no cover - graceful degradation
+        return kg_data, False, str(e)
+
+
+def _process_kg_json_row_parsed(
+    kg_json_str: str, row_index: int
+) -> Tuple[Any, bool, str]:
+    """Parse a KG JSON string and convert ids, returning the parsed value."""
+    try:
+        # Most inputs are valid JSON; only pay for the escape-fixing scan
+        # when the raw string fails to parse.
+        try:
+            data = _loads(kg_json_str)
+        except _JSON_DECODE_ERRORS:
+            data = _loads(clean_json_string(kg_json_str))
+    except _JSON_DECODE_ERRORS as e:
+        return kg_json_str, False, f"JSON decode error: {e}"
+    except TypeError as e:
+        # Non-string cells (e.g. NaN/None in the kg_json column) raise
+        # TypeError from the stdlib parser; report them as error rows
+        # rather than crashing the whole frame. orjson raises its
+        # JSONDecodeError for these, which the clause above handles.
         return kg_json_str, False, str(e)
+    return process_kg_json_row_obj(data, row_index)
+
+
+def process_kg_json_row(kg_json_str: str, row_index: int) -> Tuple[str, bool, str]:
+    """Process a single KG JSON row and convert ids to UUIDs."""
+    result, success, msg = _process_kg_json_row_parsed(kg_json_str, row_index)
+    if not success:
+        return kg_json_str, False, msg
+    return _dumps(result), True, ""
+
+
+# Below this row count, process-pool startup costs more than it saves.
+_PARALLEL_THRESHOLD = 512
+
+
+def _iter_processed(
+    kg_json_values: Any, total: int, process_row: Any, batch_size: int
+):
+    """Lazily yield ``(idx, processed, success, msg)`` per ``kg_json`` row.
+
+    Results stream out in row order as they are produced — including on
+    the process-pool path, where ``map`` yields in submission order — so
+    consumers never hold more than one in-flight result beyond whatever
+    they choose to accumulate. Chunked pipelines can consume this
+    directly instead of materializing a whole processed frame.
+    """
+    processes = os.cpu_count() or 1
+    if total > _PARALLEL_THRESHOLD and processes > 1:
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(
+                process_row, kg_json_values, range(total), chunksize=64
+            )
+            for idx, (processed, success, msg) in enumerate(results):
+                yield idx, processed, success, msg
+                if (idx + 1) % batch_size == 0:
+                    logger.info("Processed %s/%s rows", idx + 1, total)
+    else:
+        for idx, value in enumerate(kg_json_values):
+            processed, success, msg = process_row(value, idx)
+            yield idx, processed, success, msg
 
 
 def process_dataframe_kg_json(
-    df: pd.DataFrame, batch_size: int = 100
+    df: pd.DataFrame, batch_size: int = 100, *, serialize: bool = True
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-    """Process an entire dataframe of ``kg_json`` strings."""
+    """Process an entire dataframe of ``kg_json`` strings.
+
+    Rows are processed in parallel with a process pool when the dataframe
+    is large enough to amortize pool startup and multiple cores exist.
+    Per-row results stream out of :func:`_iter_processed` and are folded
+    into the output column in a single pass, so the only whole-frame
+    allocations are the input column and the result column.
+
+    With ``serialize=False`` the ``kg_json`` column of the result holds
+    the parsed (converted) values rather than re-serialized JSON strings,
+    skipping a dumps+loads round trip for callers that feed the frame
+    straight into the extractors.
+    """
     result_df = df.copy()
     errors = {
         "total_errors": 0,
         "error_rows": [],
         "json_decode_errors": 0,
     }
-    converted_json: List[str] = []
-    for idx, row in df.iterrows():
-        processed, success, msg = process_kg_json_row(row["kg_json"], idx)
+    process_row = process_kg_json_row if serialize else _process_kg_json_row_parsed
+    converted_json: List[Any] = []
+    for idx, processed, success, msg in _iter_processed(
+        df["kg_json"], len(df), process_row, batch_size
+    ):
         converted_json.append(processed)
         if not success:
             errors["total_errors"] += 1
@@ -105,33 +268,102 @@ def process_dataframe_kg_json(
             if "JSON decode" in msg:
                 errors["json_decode_errors"] += 1
             logger.error("Row %s: %s", idx, msg)
-        if (idx + 1) % batch_size == 0:
-            logger.info("Processed %s/%s rows", idx + 1, len(df))
     result_df["kg_json"] = converted_json
     return result_df, errors
 
 
-def _extract_from_chunks(
-    processed_df: pd.DataFrame, item: str
-) -> List[Dict[str, Any]]:
+def _iter_kg_chunks(kg_value: Any):
+    """Lazily yield KG chunk dicts from a raw JSON string or parsed value.
+
+    Accepting already-parsed dicts/lists lets callers that hold parsed
+    data skip a serialize/parse round trip.
+    """
+    if isinstance(kg_value, str):
+        kg_value = _loads(kg_value)
+    if isinstance(kg_value, dict):
+        yield kg_value
+    else:
+        yield from kg_value
+
+
+def _extract_both(
+    processed_df: pd.DataFrame,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Extract node and relationship rows in a single pass over the frame.
+
+    Each ``kg_json`` value is parsed once and both entity kinds are pulled
+    from the same parsed chunk, instead of re-parsing per entity kind.
+    """
+    node_rows: List[Dict[str, Any]] = []
+    rel_rows: List[Dict[str, Any]] = []
+    columns = zip(
+        processed_df["chapter"],
+        processed_df["chunk"],
+        processed_df["chunk_order_number"],
+        processed_df["author"],
+        processed_df["book"],
+        processed_df["kg_json"],
+    )
+    for chapter, chunk_text, chunk_order_number, author, book, kg_json in columns:
+        try:
+            for chunk_index, chunk in enumerate(_iter_kg_chunks(kg_json)):
+                context = {
+                    "chapter": chapter,
+                    "chunk": chunk_text,
+                    "chunk_order_number": chunk_order_number,
+                    "author": author,
+                    "book": book,
+                    "chunk_index": chunk_index,
+                }
+                for element in chunk.get("nodes", []):
+                    node_rows.append({**context, **element})
+                for element in chunk.get("relationships", []):
+                    rel_rows.append({**context, **element})
+        except Exception as e:  # pragma: no cover - log and skip
+            logger.error("Error extracting entities: %s", e)
+    return node_rows, rel_rows
+
+
+def _extract_single(processed_df: pd.DataFrame, item: str) -> List[Dict[str, Any]]:
+    """Extract only ``item`` rows, streaming large blobs when possible.
+
+    When ijson is available and a row's JSON is a large single-chunk
+    object, only the requested subtree is materialized instead of the
+    whole parsed document; everything else falls back to a full parse.
+    """
     rows: List[Dict[str, Any]] = []
-    for _, row in processed_df.iterrows():
+    columns = zip(
+        processed_df["chapter"],
+        processed_df["chunk"],
+        processed_df["chunk_order_number"],
+        processed_df["author"],
+        processed_df["book"],
+        processed_df["kg_json"],
+    )
+    for chapter, chunk_text, chunk_order_number, author, book, kg_json in columns:
         try:
-            kg_data = json.loads(row["kg_json"])
-            chunks = [kg_data] if isinstance(kg_data, dict) else kg_data
-            for chunk_index, chunk in enumerate(chunks):
-                for element in chunk.get(item, []):
-                    rows.append(
-                        {
-                            "chapter": row["chapter"],
-                            "chunk": row["chunk"],
-                            "chunk_order_number": row["chunk_order_number"],
-                            "author": row["author"],
-                            "book": row["book"],
-                            "chunk_index": chunk_index,
-                            **element,
-                        }
-                    )
+            context = {
+                "chapter": chapter,
+                "chunk": chunk_text,
+                "chunk_order_number": chunk_order_number,
+                "author": author,
+                "book": book,
+            }
+            if (
+                ijson is not None
+                and isinstance(kg_json, str)
+                and len(kg_json) > _STREAM_THRESHOLD
+                and kg_json.lstrip().startswith("{")
+            ):
+                elements = ijson.items(
+                    io.BytesIO(kg_json.encode()), f"{item}.item", use_float=True
+                )
+                for element in elements:
+                    rows.append({**context, "chunk_index": 0, **element})
+            else:
+                for chunk_index, chunk in enumerate(_iter_kg_chunks(kg_json)):
+                    for element in chunk.get(item, []):
+                        rows.append({**context, "chunk_index": chunk_index, **element})
         except Exception as e:  # pragma: no cover - log and skip
             logger.error("Error extracting %s: %s", item, e)
     return rows
@@ -139,21 +371,20 @@ def _extract_from_chunks(
 
 def extract_nodes_from_kg_json(processed_df: pd.DataFrame) -> pd.DataFrame:
     """Extract nodes from a processed dataframe into a new dataframe."""
-    rows = _extract_from_chunks(processed_df, "nodes")
-    return pd.DataFrame(rows)
+    return pd.DataFrame(_extract_single(processed_df, "nodes"))
 
 
 def extract_relationships_from_kg_json(processed_df: pd.DataFrame) -> pd.DataFrame:
     """Extract relationships from a processed dataframe into a new dataframe."""
-    rows = _extract_from_chunks(processed_df, "relationships")
-    return pd.DataFrame(rows)
+    return pd.DataFrame(_extract_single(processed_df, "relationships"))
 
 
 def extract_all_entities(processed_df: pd.DataFrame) -> pd.DataFrame:
-    """Extract nodes and relationships together."""
-    nodes = extract_nodes_from_kg_json(processed_df)
-    relationships = extract_relationships_from_kg_json(processed_df)
-    nodes["entity_type"] = "node"
-    relationships["entity_type"] = "relationship"
-    return pd.concat([nodes, relationships], ignore_index=True)
+    """Extract nodes and relationships together in one parse pass."""
+    node_rows, rel_rows = _extract_both(processed_df)
+    for row in node_rows:
+        row["entity_type"] = "node"
+    for row in rel_rows:
+        row["entity_type"] = "relationship"
+    return pd.DataFrame(node_rows + rel_rows)
 
@@ -2,58 +2,86 @@
 Knowledge graph generation and export functionality.
 """
 
+import asyncio
 import json
+from dataclasses import asdict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from .models import KnowledgeGraph, Node, Relationship, NovelData, NovelChunk
+from .models import KnowledgeGraph, Node, Relationship, NovelData, NovelChunk, EntityType
 from .gemini_client import GeminiClient
 
+try:  # optional SIMD-accelerated JSON serializer
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+async def _generate_chunk_graphs(
+    client: GeminiClient, chunks: List[NovelChunk], max_concurrency: int
+) -> List[KnowledgeGraph]:
+    """Generate per-chunk graphs concurrently, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(chunk: NovelChunk) -> KnowledgeGraph:
+        async with semaphore:
+            return await client.generate_knowledge_graph_async(chunk)
+
+    return await asyncio.gather(*(_one(chunk) for chunk in chunks))
+
 
 def generate_knowledge_graph(
-    novel_data: NovelData, api_key: Optional[str] = None
+    novel_data: NovelData, api_key: Optional[str] = None, max_concurrency: int = 16
 ) -> KnowledgeGraph:
     """
     Generate a knowledge graph from novel data.
 
+    Chunks have no data dependency on each other, so their Gemini requests
+    run concurrently (bounded by max_concurrency to respect rate limits);
+    only the ID remapping below stays sequential.
+
     Args:
         novel_data: NovelData object containing the novel chunks
         api_key: Optional Gemini API key
+        max_concurrency: Maximum number of in-flight Gemini requests
 
     Returns:
         KnowledgeGraph object containing the generated knowledge graph
     """
     client = GeminiClient(api_key=api_key)
 
-    # Process each chunk and combine the results
+    chunk_graphs = asyncio.run(
+        _generate_chunk_graphs(client, novel_data.chunks, max_concurrency)
+    )
+
+    # Combine the per-chunk results in chunk order
     all_nodes: List[Node] = []
     all_relationships: List[Relationship] = []
+    entity_types: set = set()
     node_id_counter = 1
 
-    for chunk in novel_data.chunks:
-        chunk_graph = client.generate_knowledge_graph(chunk)
-
+    for chunk_graph in chunk_graphs:
         # Update node IDs to be globally unique
         node_id_map = {}
         for node in chunk_graph.nodes:
-            new_id = node_id_counter
-            node_id_map[node.id] = new_id
-            node.id = new_id
+            node_id_map[node.id] = node_id_counter
+            node.id = node_id_counter
             node_id_counter += 1
-            all_nodes.append(node)
+            entity_types.add(node.label.value)
+        all_nodes.extend(chunk_graph.nodes)
 
         # Update relationship IDs to match new node IDs
         for rel in chunk_graph.relationships:
             rel.start_id = node_id_map[rel.start_id]
             rel.end_id = node_id_map[rel.end_id]
-            all_relationships.append(rel)
+        all_relationships.extend(chunk_graph.relationships)
 
     # Create metadata
     metadata = {
         "generated_at": datetime.utcnow().isoformat(),
         "total_nodes": len(all_nodes),
         "total_relationships": len(all_relationships),
-        "entity_types": list(set(node.label.value for node in all_nodes)),
+        "entity_types": list(entity_types),
         "book": novel_data.book,
         "author": novel_data.author,
     }
@@ -63,48 +91,41 @@ def generate_knowledge_graph(
     )
 
 
+def _encode_for_export(obj: Any) -> Any:
+    """Fallback encoder for types the JSON serializer doesn't handle."""
+    if isinstance(obj, EntityType):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def export_knowledge_graph(graph: KnowledgeGraph, output_path: str) -> None:
     """
     Export a knowledge graph to a JSON file.
 
+    Serializes straight from the dataclasses instead of materializing an
+    intermediate list-of-dicts copy of the whole graph first.
+
     Args:
         graph: KnowledgeGraph object to export
         output_path: Path where the JSON file should be saved
     """
-    # Convert the graph to a dictionary
-    graph_dict = {
-        "metadata": graph.metadata,
-        "nodes": [
-            {
-                "id": node.id,
-                "label": node.label.value,
-                "name": node.name,
-                "description": node.description,
-                "properties": node.properties,
-                "timestamp": node.timestamp.isoformat(),
-            }
-            for node in graph.nodes
-        ],
-        "relationships": [
-            {
-                "start_id": rel.start_id,
-                "end_id": rel.end_id,
-                "relationship_type": rel.relationship_type,
-                "weight": rel.weight,
-                "properties": rel.properties,
-                "timestamp": rel.timestamp.isoformat(),
-            }
-            for rel in graph.relationships
-        ],
-    }
-
     # Create output directory if it doesn't exist
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(graph_dict, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(
+                graph,
+                default=_encode_for_export,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+            )
+        )
+    else:
+        with open(output_path, "w") as f:
+            json.dump(asdict(graph), f, indent=2, default=_encode_for_export)
 
 
 def generate_memgraph_import_commands(graph_path: str) -> str:
@@ -22,7 +22,7 @@ class EntityType(str, Enum):
     CHUNK = "Chunk"
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Knowledge graph node model."""
 
@@ -34,7 +34,7 @@ class Node:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """Knowledge graph relationship model."""
 
@@ -55,7 +55,7 @@ class KnowledgeGraph:
     relationships: List[Relationship]
 
 
-@dataclass
+@dataclass(slots=True)
 class NovelChunk:
     """Model for a chunk of novel text."""
 
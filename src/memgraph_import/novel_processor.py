@@ -8,6 +8,18 @@ from typing import List, Optional
 from datetime import datetime
 from .models import NovelChunk, NovelData
 
+# Precompiled patterns shared across invocations (files are often
+# processed in a loop, so avoid per-call pattern-cache lookups).
+_START_RE = re.compile(r"\*\*\* START OF THE PROJECT GUTENBERG EBOOK [^*]+\*\*\*")
+_END_RE = re.compile(r"\*\*\* END OF THE PROJECT GUTENBERG EBOOK [^*]+\*\*\*")
+_CHAPTER_RE = re.compile(r"^(CHAPTER [IVXLCDM]+\.)", re.MULTILINE)
+_PARA_RE = re.compile(r"\n\s*\n+")
+# Combined boundary pattern for the single-pass chunker: a match is either
+# a chapter heading or a paragraph break.
+_BOUNDARY_RE = re.compile(
+    r"(?P<chap>^CHAPTER [IVXLCDM]+\.)|(?P<para>\n\s*\n+)", re.MULTILINE
+)
+
 
 def novel_to_dataframe(novel_text: str) -> pd.DataFrame:
     """
@@ -21,88 +33,51 @@ def novel_to_dataframe(novel_text: str) -> pd.DataFrame:
         A pandas DataFrame with columns 'chapter', 'chunk', and 'chunk_order_number'.
     """
     # Remove Project Gutenberg headers/footers
-    start_marker_pattern = r"\*\*\* START OF THE PROJECT GUTENBERG EBOOK [^*]+\*\*\*"
-    end_marker_pattern = r"\*\*\* END OF THE PROJECT GUTENBERG EBOOK [^*]+\*\*\*"
-
-    # Remove text before the start marker
-    start_match = re.search(start_marker_pattern, novel_text)
+    start_match = _START_RE.search(novel_text)
     if start_match:
         novel_text = novel_text[start_match.end() :]
 
-    # Remove text after the end marker
-    end_match = re.search(end_marker_pattern, novel_text)
+    end_match = _END_RE.search(novel_text)
     if end_match:
         novel_text = novel_text[: end_match.start()]
 
     novel_text = novel_text.strip()
 
-    chapters_data = []
-    chunk_order_counter = 0
-
-    # Regex to find chapter titles
-    chapter_pattern = re.compile(r"^(CHAPTER [IVXLCDM]+\.)", re.MULTILINE)
-    matches = list(chapter_pattern.finditer(novel_text))
-
-    if not matches:
-        # If no chapters found, treat whole text as chunks under 'Unknown' chapter
-        paragraphs = re.split(r"\n\s*\n+", novel_text)
-        for para_content in paragraphs:
-            para_cleaned = para_content.strip()
-            if para_cleaned:
-                chunk_order_counter += 1
-                chapters_data.append(
-                    {
-                        "chapter": "Unknown",
-                        "chunk": para_cleaned,
-                        "chunk_order_number": chunk_order_counter,
-                    }
-                )
-        if chapters_data:
-            return pd.DataFrame(chapters_data)
-        else:
-            return pd.DataFrame(columns=["chapter", "chunk", "chunk_order_number"])
-
-    # Process text before first chapter
-    first_chapter_start_index = matches[0].start()
-    text_before_first_chapter = novel_text[:first_chapter_start_index].strip()
-    if text_before_first_chapter:
-        paragraphs_before = re.split(r"\n\s*\n+", text_before_first_chapter)
-        for para_content in paragraphs_before:
-            para_cleaned = para_content.strip()
-            if para_cleaned:
-                chunk_order_counter += 1
-                chapters_data.append(
-                    {
-                        "chapter": "Preamble",
-                        "chunk": para_cleaned,
-                        "chunk_order_number": chunk_order_counter,
-                    }
-                )
-
-    # Process each chapter
-    for i, match in enumerate(matches):
-        chapter_title = match.group(1)
-        content_start_index = match.end()
-        content_end_index = (
-            matches[i + 1].start() if i + 1 < len(matches) else len(novel_text)
-        )
-        chapter_content = novel_text[content_start_index:content_end_index].strip()
-
-        # Split chapter content into paragraphs
-        paragraphs = re.split(r"\n\s*\n+", chapter_content)
-        for para_content in paragraphs:
-            para_cleaned = para_content.strip()
-            if para_cleaned:
-                chunk_order_counter += 1
-                chapters_data.append(
-                    {
-                        "chapter": chapter_title,
-                        "chunk": para_cleaned,
-                        "chunk_order_number": chunk_order_counter,
-                    }
-                )
-
-    return pd.DataFrame(chapters_data)
+    # Column-oriented accumulation: parallel lists are cheaper to build
+    # than per-row dicts and let pandas fast-path the column construction.
+    chapters: List[str] = []
+    chunks: List[str] = []
+
+    # Single pass: walk chapter headings and paragraph breaks together,
+    # emitting the text between boundaries without slicing out whole
+    # chapters as intermediate strings first.
+    has_chapters = _CHAPTER_RE.search(novel_text) is not None
+    current_chapter = "Preamble" if has_chapters else "Unknown"
+
+    def _emit(start: int, end: int) -> None:
+        paragraph = novel_text[start:end].strip()
+        if paragraph:
+            chapters.append(current_chapter)
+            chunks.append(paragraph)
+
+    pos = 0
+    for match in _BOUNDARY_RE.finditer(novel_text):
+        _emit(pos, match.start())
+        if match.lastgroup == "chap":
+            current_chapter = match.group("chap")
+        pos = match.end()
+    _emit(pos, len(novel_text))
+
+    if not chunks and not has_chapters:
+        return pd.DataFrame(columns=["chapter", "chunk", "chunk_order_number"])
+
+    return pd.DataFrame(
+        {
+            "chapter": chapters,
+            "chunk": chunks,
+            "chunk_order_number": range(1, len(chunks) + 1),
+        }
+    )
 
 
 def dataframe_to_novel_data(df: pd.DataFrame, author: str, book: str) -> NovelData:
@@ -119,13 +94,15 @@ def dataframe_to_novel_data(df: pd.DataFrame, author: str, book: str) -> NovelDa
     """
     chunks = [
         NovelChunk(
-            chapter=row["chapter"],
-            chunk=row["chunk"],
-            chunk_order_number=row["chunk_order_number"],
+            chapter=chapter,
+            chunk=chunk,
+            chunk_order_number=chunk_order_number,
             author=author,
             book=book,
         )
-        for _, row in df.iterrows()
+        for chapter, chunk, chunk_order_number in zip(
+            df["chapter"], df["chunk"], df["chunk_order_number"]
+        )
     ]
     return NovelData(chunks=chunks, author=author, book=book)
 
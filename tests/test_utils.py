@@ -1,43 +1,128 @@
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+import array
+import collections
 import importlib
+import itertools
 import json
 import types
 
+import pytest
+
+try:  # match the package's optional fast JSON path
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+
+def _loads(s):
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
 # --- Fake pandas -----------------------------------------------------------
+def _as_column(values):
+    """Pack homogeneous numeric columns into a typed array.array.
+
+    Ints go to 'q' and floats to 'd' (unboxed, ~8 bytes each instead of a
+    boxed Python object per cell); anything mixed stays a plain list.
+    """
+    values = list(values)
+    if values:
+        if all(type(v) is int for v in values):
+            return array.array("q", values)
+        if all(type(v) is float for v in values):
+            return array.array("d", values)
+    return values
+
+
 class FakeDataFrame:
+    """Minimal DataFrame stand-in with columnar (dict-of-lists) storage."""
+
+    __slots__ = ("columns", "cols", "n")
+
     def __init__(self, data=None, columns=None):
-        self.data = [dict(row) for row in (data or [])]
-        self.columns = columns or (list(self.data[0].keys()) if self.data else [])
+        rows = list(data or [])
+        # Tuple: immutable, hashable, and shared (not copied) by copy().
+        # Like pandas, the column set is the key union across all rows.
+        self.columns = (
+            tuple(columns)
+            if columns
+            else tuple(dict.fromkeys(k for row in rows for k in row))
+        )
+        self.n = len(rows)
+        self.cols = {c: _as_column(row.get(c) for row in rows) for c in self.columns}
+
+    @property
+    def data(self):
+        if not self.columns:
+            return [{} for _ in range(self.n)]
+        # zip runs the per-row transposition in C; no per-cell indexing.
+        return [
+            dict(zip(self.columns, row))
+            for row in zip(*(self.cols[c] for c in self.columns))
+        ]
 
     def copy(self):
-        return FakeDataFrame([dict(row) for row in self.data], columns=list(self.columns))
+        # Bypass __init__: each column copies with one C-level slice.
+        new = FakeDataFrame.__new__(FakeDataFrame)
+        new.columns = self.columns
+        new.n = self.n
+        new.cols = {c: v[:] for c, v in self.cols.items()}
+        return new
 
     def iterrows(self):
-        for idx, row in enumerate(self.data):
-            yield idx, row
+        if not self.columns:
+            yield from ((i, {}) for i in range(self.n))
+            return
+        for i, row in enumerate(zip(*(self.cols[c] for c in self.columns))):
+            yield i, dict(zip(self.columns, row))
+
+    def itertuples(self, index=True, name="Row"):
+        # Mirrors the pandas fast path: one namedtuple class per call,
+        # no per-row dict construction.
+        fields = (["Index"] if index else []) + list(self.columns)
+        make = tuple if name is None else collections.namedtuple(name, fields, rename=True)._make
+        for i in range(self.n):
+            values = tuple(self.cols[c][i] for c in self.columns)
+            yield make(((i,) + values) if index else values)
 
     def __getitem__(self, key):
-        return [row.get(key) for row in self.data]
+        if key not in self.cols:
+            return [None] * self.n
+        return self.cols[key]
 
     def __setitem__(self, key, value):
-        if isinstance(value, list):
-            for row, val in zip(self.data, value):
-                row[key] = val
-        else:
-            for row in self.data:
-                row[key] = value
+        if key not in self.cols:
+            self.columns += (key,)
+        self.cols[key] = _as_column(
+            value if isinstance(value, (list, array.array)) else [value] * self.n
+        )
 
     def __len__(self):
-        return len(self.data)
+        return self.n
 
 
 def fake_concat(dfs, ignore_index=False):
-    combined = []
-    for df in dfs:
-        combined.extend(df.data)
-    return FakeDataFrame(combined)
+    # Union of columns in first-seen order, then one list() build per
+    # column instead of growing empty lists with repeated extends.
+    columns = list(dict.fromkeys(c for df in dfs for c in df.columns))
+    merged = {
+        c: list(
+            itertools.chain.from_iterable(
+                df.cols.get(c, [None] * df.n) for df in dfs
+            )
+        )
+        for c in columns
+    }
+    out = FakeDataFrame()
+    out.columns = tuple(columns)
+    out.cols = merged
+    out.n = sum(df.n for df in dfs)
+    return out
 
 fake_pd = types.ModuleType("pandas")
 fake_pd.DataFrame = FakeDataFrame
@@ -46,19 +131,32 @@ sys.modules.setdefault("pandas", fake_pd)
 
 # --- Fake neo4j ------------------------------------------------------------
 class FakeTx:
+    def __init__(self, calls=None):
+        self.calls = calls if calls is not None else []
+
     def run(self, *args, **kwargs):
-        pass
+        self.calls.append((args, kwargs))
 
     def commit(self):
         pass
 
 
 class FakeSession:
+    def __init__(self, calls=None):
+        self.calls = calls if calls is not None else []
+
     def run(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
         return 1
 
     def begin_transaction(self):
-        return FakeTx()
+        return FakeTx(self.calls)
+
+    def execute_write(self, fn, *args, **kwargs):
+        return fn(FakeTx(self.calls), *args, **kwargs)
+
+    def close(self):
+        pass
 
     def __enter__(self):
         return self
@@ -68,8 +166,11 @@ class FakeSession:
 
 
 class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
     def session(self):
-        return FakeSession()
+        return FakeSession(self.calls)
 
     def close(self):
         pass
@@ -79,19 +180,45 @@ class FakeGraphDatabase:
     @staticmethod
     def driver(uri, auth=None):
         return FakeDriver()
-fake_google = types.ModuleType("google")
-fake_google.genai = types.ModuleType("google.genai")
-sys.modules.setdefault("google", fake_google)
-fake_google.genai.types = types.SimpleNamespace()
-sys.modules.setdefault("google.genai", fake_google.genai)
-
-fake_neo4j = types.ModuleType("neo4j")
-fake_neo4j.GraphDatabase = FakeGraphDatabase
-sys.modules.setdefault("neo4j", fake_neo4j)
-
-# Reload modules with fakes present
-utils = importlib.reload(importlib.import_module("memgraph_import.kg_json_utils"))
-importer_mod = importlib.reload(importlib.import_module("memgraph_import.memgraph_importer"))
+# Only fabricate fake modules that are actually missing; when the real
+# dependency is installed the module objects are never allocated. The
+# pandas, google, and neo4j fakes must all exist before the package
+# import below, because the package __init__ imports every submodule
+# (gemini_client needs google, memgraph_importer needs neo4j).
+if "google" not in sys.modules:
+    fake_google = types.ModuleType("google")
+    fake_google.genai = types.ModuleType("google.genai")
+    fake_google.genai.types = types.SimpleNamespace()
+    sys.modules["google"] = fake_google
+    sys.modules["google.genai"] = fake_google.genai
+
+if "neo4j" not in sys.modules:
+    fake_neo4j = types.ModuleType("neo4j")
+    fake_neo4j.GraphDatabase = FakeGraphDatabase
+    sys.modules["neo4j"] = fake_neo4j
+else:
+    fake_neo4j = sys.modules["neo4j"]
+
+# Import (or reload) the modules under test with the fakes present.
+# Reloading unconditionally would re-execute the modules and wipe their
+# lru_caches on every collection in the same interpreter, so only reload
+# when a previous import bound the real dependencies.
+utils = sys.modules.get("memgraph_import.kg_json_utils")
+if utils is None:
+    utils = importlib.import_module("memgraph_import.kg_json_utils")
+elif utils.pd is not sys.modules["pandas"]:
+    utils = importlib.reload(utils)
+
+
+@pytest.fixture(scope="session")
+def importer_mod():
+    """Bind memgraph_importer lazily, only for the importer tests."""
+    mod = sys.modules.get("memgraph_import.memgraph_importer")
+    if mod is None:
+        mod = importlib.import_module("memgraph_import.memgraph_importer")
+    elif mod.GraphDatabase is not fake_neo4j.GraphDatabase:
+        mod = importlib.reload(mod)
+    return mod
 
 
 def test_generate_deterministic_uuid_consistency():
@@ -114,15 +241,23 @@ def test_convert_nodes_to_uuid():
 
 
 def test_process_kg_json_row_success():
-    json_str = json.dumps({"nodes": [{"id": 1, "label": "Actor", "name": "Tom"}], "relationships": []})
+    json_str = _dumps({"nodes": [{"id": 1, "label": "Actor", "name": "Tom"}], "relationships": []})
     result, success, msg = utils.process_kg_json_row(json_str, 0)
     assert success is True
-    parsed = json.loads(result)
+    parsed = _loads(result)
     assert parsed["nodes"][0]["id"] != 1
 
 
+def test_process_kg_json_row_non_string_input():
+    # NaN/None cells must come back as error rows, not raise.
+    result, success, msg = utils.process_kg_json_row(None, 0)
+    assert success is False
+    assert result is None
+    assert msg
+
+
 def test_process_dataframe_kg_json_and_extract():
-    df = FakeDataFrame([{"kg_json": json.dumps({"nodes": [{"id": 1, "label": "Actor", "name": "Tom"}], "relationships": []}),
+    df = FakeDataFrame([{"kg_json": _dumps({"nodes": [{"id": 1, "label": "Actor", "name": "Tom"}], "relationships": []}),
                          "chapter": "1", "chunk": "c", "chunk_order_number": 0, "author": "a", "book": "b"}])
     processed, stats = utils.process_dataframe_kg_json(df)
     assert stats["total_errors"] == 0
@@ -130,7 +265,17 @@ def test_process_dataframe_kg_json_and_extract():
     assert len(entities.data) == 1  # one node + relationships (0)
 
 
-def test_memgraph_importer_connect_and_close():
+def test_process_dataframe_kg_json_without_serialization():
+    df = FakeDataFrame([{"kg_json": _dumps({"nodes": [{"id": 1, "label": "Actor", "name": "Tom"}], "relationships": []}),
+                         "chapter": "1", "chunk": "c", "chunk_order_number": 0, "author": "a", "book": "b"}])
+    processed, stats = utils.process_dataframe_kg_json(df, serialize=False)
+    assert stats["total_errors"] == 0
+    assert isinstance(processed["kg_json"][0], dict)  # parsed, not a JSON string
+    entities = utils.extract_all_entities(processed)
+    assert len(entities.data) == 1
+
+
+def test_memgraph_importer_connect_and_close(importer_mod):
     imp = importer_mod.MemgraphImporter()
     assert imp.connect() is True
     imp.create_indexes()
@@ -141,3 +286,30 @@ def test_memgraph_importer_connect_and_close():
     ])
     assert count_rel == 1
     imp.close()
+
+
+def test_memgraph_importer_batches_in_single_query(importer_mod):
+    imp = importer_mod.MemgraphImporter()
+    assert imp.connect() is True
+    nodes = [{"label": "Actor", "props": {"id": str(i)}} for i in range(3)]
+    assert imp.import_nodes_batch(nodes) == 3
+    batch_calls = [
+        (args, kwargs)
+        for args, kwargs in imp.driver.calls
+        if args and "UNWIND" in args[0]
+    ]
+    # The whole batch travels in one UNWIND query, not one query per node.
+    assert len(batch_calls) == 1
+    assert len(batch_calls[0][1]["rows"]) == 3
+    imp.close()
+
+
+def test_memgraph_importer_escapes_label_backticks(importer_mod):
+    imp = importer_mod.MemgraphImporter()
+    assert imp.connect() is True
+    # A backtick in an LLM-produced label must stay inside the quoted
+    # identifier instead of terminating it.
+    imp.import_nodes_batch([{"label": "Actor`) DETACH DELETE n //", "props": {"id": "1"}}])
+    query = next(args[0] for args, _ in imp.driver.calls if "UNWIND" in args[0])
+    assert "(n:`Actor``) DETACH DELETE n //`)" in query
+    imp.close()